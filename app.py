@@ -1,15 +1,51 @@
 import streamlit as st
-from PIL import Image, ImageSequence, UnidentifiedImageError
+from streamlit.logger import get_logger
+import PIL
+from PIL import Image, UnidentifiedImageError
+import functools
+import hashlib
 import io
 import os
+import re
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from tempfile import SpooledTemporaryFile
+from types import MappingProxyType
 from typing import List, Tuple
 
+import numpy as np
+
+try:
+    import simplejpeg  # libjpeg-turbo encoder, noticeably faster than Pillow's JPEG path
+except ImportError:
+    simplejpeg = None
+
+try:
+    import cv2  # OpenCV's PNG encoder is considerably faster than Pillow's
+except ImportError:
+    cv2 = None
+
+try:
+    import imagecodecs  # measured faster than Pillow at decoding large still WEBPs, even on one core
+except ImportError:
+    imagecodecs = None
+
 # ------------------------
 # App configuration & styles
 # ------------------------
 APP_NAME = "FormatForge — Instant Image Alchemist"
 
+# Streamlit's logger has a handler configured; a plain logging.getLogger here would stay silent
+logger = get_logger(__name__)
+
+@st.cache_resource(show_spinner=False)
+def log_pil_version():
+    # cached so it runs once per server process, not on every rerun
+    # Pillow-SIMD reports versions like "9.0.0.post1"; useful to confirm which build is active
+    logger.info("Using Pillow %s", PIL.__version__)
+
+log_pil_version()
+
 def set_page_config():
     st.set_page_config(
         page_title=APP_NAME,
@@ -36,46 +72,81 @@ def set_page_config():
 # ------------------------
 # Utilities
 # ------------------------
+FORMAT_ALIASES = MappingProxyType({
+    "jpg": "JPEG",
+    "jpeg": "JPEG",
+    "png": "PNG",
+    "ico": "ICO",
+    "icon": "ICO",
+    "gif": "GIF",
+    "bmp": "BMP",
+    "webp": "WEBP",
+    "tiff": "TIFF",
+    "tif": "TIFF",
+})
+
+FORMAT_EXTENSIONS = MappingProxyType({
+    "JPEG": ".jpg",
+    "PNG": ".png",
+    "ICO": ".ico",
+    "GIF": ".gif",
+    "BMP": ".bmp",
+    "WEBP": ".webp",
+    "TIFF": ".tiff",
+})
+
+# called for every file and preview with a handful of distinct values; bounded since
+# names can come from filename extensions
+@functools.lru_cache(maxsize=128)
 def normalize_format_name(name: str) -> str:
     if not name:
         return ""
     name = name.strip().lower()
-    mapping = {
-        "jpg": "JPEG",
-        "jpeg": "JPEG",
-        "png": "PNG",
-        "ico": "ICO",
-        "icon": "ICO",
-        "gif": "GIF",
-        "bmp": "BMP",
-        "webp": "WEBP",
-        "tiff": "TIFF",
-        "tif": "TIFF",
-    }
-    return mapping.get(name, name.upper())
+    return FORMAT_ALIASES.get(name, name.upper())
 
 def get_extension_for_format(format_name: str) -> str:
     fmt = normalize_format_name(format_name)
-    ext_map = {
-        "JPEG": ".jpg",
-        "PNG": ".png",
-        "ICO": ".ico",
-        "GIF": ".gif",
-        "BMP": ".bmp",
-        "WEBP": ".webp",
-        "TIFF": ".tiff",
-    }
-    return ext_map.get(fmt, f".{fmt.lower()}")
+    return FORMAT_EXTENSIONS.get(fmt, f".{fmt.lower()}")
 
-def read_image_from_upload(uploaded_file) -> Image.Image:
+def is_plain_still_webp(header: bytes) -> bool:
+    """True for a still WEBP without an ICC profile, i.e. one imagecodecs can decode losslessly."""
+    if len(header) < 21 or header[:4] != b"RIFF" or header[8:12] != b"WEBP":
+        return False
+    # extended (VP8X) files flag an ICC profile in bit 5 and animation in bit 1 of the first flags byte
+    return not (header[12:16] == b"VP8X" and header[20] & (0x20 | 0x02))
+
+def read_image_from_upload(uploaded_file, draft_size: Tuple[int,int] = None) -> Image.Image:
     uploaded_file.seek(0)
-    image_bytes = uploaded_file.read()
-    buf = io.BytesIO(image_bytes)
-    img = Image.open(buf)
+    if imagecodecs is not None and is_plain_still_webp(uploaded_file.read(21)):
+        img = Image.fromarray(imagecodecs.webp_decode(uploaded_file.getvalue()))
+        # fromarray leaves format unset, and format validation relies on it
+        img.format = "WEBP"
+        return img
+
+    # UploadedFile is already a BytesIO, so decode from it without copying the bytes
+    uploaded_file.seek(0)
+    img = Image.open(uploaded_file)
+    if draft_size and img.format == "JPEG":
+        # let libjpeg downscale during decode (1/2, 1/4, 1/8) while staying >= draft_size
+        img.draft(img.mode, draft_size)
     img.load()
-    # keep original bytes available via uploaded_file
     return img
 
+def decode_upload(uploaded_file, decoded_cache: dict, draft_size: Tuple[int,int] = None) -> Image.Image:
+    """read_image_from_upload, reused across reruns while the file stays in the uploader.
+
+    decoded_cache maps file_id -> (draft_size, image) and holds one decode per upload.
+    """
+    cached = decoded_cache.get(uploaded_file.file_id)
+    if cached is not None and cached[0] == draft_size:
+        return cached[1]
+    img = read_image_from_upload(uploaded_file, draft_size=draft_size)
+    decoded_cache[uploaded_file.file_id] = (draft_size, img)
+    return img
+
+def upload_digest(uploaded_file) -> str:
+    return hashlib.blake2b(uploaded_file.getvalue(), digest_size=16).hexdigest()
+
 def image_format_from_pil(img: Image.Image, filename_hint: str = "") -> str:
     fmt = getattr(img, "format", None)
     if fmt:
@@ -88,18 +159,135 @@ def image_format_from_pil(img: Image.Image, filename_hint: str = "") -> str:
     # fallback to mode
     return img.mode.upper()
 
+SIZE_PATTERN = re.compile(r"\s*(\d+)\s*")
+
 def parse_custom_sizes(text: str) -> List[Tuple[int,int]]:
-    """Parse comma-separated sizes like '16,32,48' into list of tuples."""
-    try:
-        parts = [p.strip() for p in text.split(",") if p.strip()]
-        sizes = []
-        for p in parts:
-            val = int(p)
+    """Parse comma-separated sizes like '16,32,48' into list of tuples.
+
+    Tokens that aren't a plain positive integer (e.g. '12.5', '-16', '16x16') are dropped.
+    """
+    sizes = []
+    for token in text.split(","):
+        match = SIZE_PATTERN.fullmatch(token)
+        if match:
+            val = int(match.group(1))
             if val > 0:
                 sizes.append((val, val))
-        return sizes
+    return sizes
+
+def parse_hex_color(text: str) -> Tuple[int,int,int]:
+    """Parse a '#RRGGBB' color string into an (r, g, b) tuple."""
+    r, g, b = bytes.fromhex(text.lstrip("#"))
+    return r, g, b
+
+# convert() always copies the pixel buffer, even when the mode already matches
+def to_rgba(img: Image.Image) -> Image.Image:
+    return img if img.mode == "RGBA" else img.convert("RGBA")
+
+def to_rgb(img: Image.Image) -> Image.Image:
+    return img if img.mode == "RGB" else img.convert("RGB")
+
+def iter_frames_rgba(img: Image.Image, start: int = 0):
+    """Yield frames of a multi-frame image as RGBA without holding them all in memory."""
+    try:
+        for i in range(start, getattr(img, "n_frames", 1)):
+            img.seek(i)
+            # convert() returns a copy, which matters since seek() mutates img in place
+            yield img.convert("RGBA")
+    finally:
+        img.seek(0)
+
+def composite_on_background(img: Image.Image, bg_rgb: Tuple[int,int,int]) -> Image.Image:
+    """Flatten img onto an opaque RGB background; images without transparency are just converted."""
+    if img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info):
+        # composite onto background color: one C pass over an opaque RGBA background
+        bg = Image.new("RGBA", img.size, tuple(bg_rgb) + (255,))
+        return Image.alpha_composite(bg, to_rgba(img)).convert("RGB")
+    return to_rgb(img)
+
+# ------------------------
+# Per-format savers
+# ------------------------
+# Each saver writes img encoded as target into out_buffer and ignores options meant for other formats.
+def save_generic(img: Image.Image, out_buffer: io.BytesIO, target: str, **_):
+    # Some formats require conversion; Pillow handles many automatically
+    img.save(out_buffer, format=target)
+
+def save_jpeg(img: Image.Image, out_buffer: io.BytesIO, target: str, jpeg_bg_rgb: Tuple[int,int,int] = (255,255,255), **_):
+    img_to_save = composite_on_background(img, jpeg_bg_rgb)
+    if simplejpeg is not None:
+        # img_to_save is always RGB here; quality and 4:2:0 subsampling match Pillow's defaults
+        # (simplejpeg would otherwise use 4:4:4 and produce much larger files)
+        arr = np.asarray(img_to_save)
+        out_buffer.write(simplejpeg.encode_jpeg(arr, quality=75, colorspace="RGB", colorsubsampling="420", fastdct=True))
+    else:
+        img_to_save.save(out_buffer, format="JPEG")
+
+def save_png(img: Image.Image, out_buffer: io.BytesIO, target: str, **_):
+    # OpenCV writes bare pixels, so images carrying an ICC profile or a tRNS colour key stay on Pillow
+    use_cv2 = (
+        cv2 is not None
+        and img.mode in ("RGB", "RGBA")
+        and "icc_profile" not in img.info
+        and "transparency" not in img.info
+    )
+    if use_cv2:
+        # OpenCV expects BGR(A) channel order; other modes keep Pillow's lossless handling
+        arr = np.asarray(img)
+        code = cv2.COLOR_RGBA2BGRA if img.mode == "RGBA" else cv2.COLOR_RGB2BGR
+        ok, enc = cv2.imencode(".png", cv2.cvtColor(arr, code), [cv2.IMWRITE_PNG_COMPRESSION, 3])
+        if not ok:
+            raise ValueError("OpenCV failed to encode PNG")
+        out_buffer.write(enc.tobytes())
+    else:
+        img.save(out_buffer, format="PNG")
+
+def build_ico_pyramid(img: Image.Image, sizes: List[Tuple[int,int]]) -> List[Image.Image]:
+    """Downscale a square img through each requested size in turn, returning frames smallest first."""
+    # like Pillow's ICO writer, skip sizes larger than the source or 256
+    limit = min(img.width, 256)
+    frames = []
+    cur = img
+    for side in sorted({w for w, h in sizes if w == h and w <= limit}, reverse=True):
+        if cur.size != (side, side):
+            cur = cur.resize((side, side), Image.LANCZOS)
+        frames.append(cur)
+    return frames[::-1]
+
+def save_ico(img: Image.Image, out_buffer: io.BytesIO, target: str, ico_sizes: List[Tuple[int,int]] = None, **_):
+    save_kwargs = {}
+    if ico_sizes:
+        save_kwargs["sizes"] = ico_sizes
+        # Pillow uses a provided frame when its size matches exactly; non-square sources keep Pillow's own thumbnails
+        if img.width == img.height:
+            save_kwargs["append_images"] = build_ico_pyramid(img, ico_sizes)
+    img.save(out_buffer, format="ICO", **save_kwargs)
+
+def save_gif(img: Image.Image, out_buffer: io.BytesIO, target: str, preserve_animation: bool = True, **_):
+    if not (getattr(img, "is_animated", False) and preserve_animation):
+        img.save(out_buffer, format="GIF")
+        return
+    duration = img.info.get("duration", 100)
+    loop = img.info.get("loop", 0)
+    try:
+        img.seek(0)
+        # must stay a copy (not to_rgba): iter_frames_rgba seeks img, which mutates it in place
+        first = img.convert("RGBA")
+        # the encoder pulls the remaining frames one at a time from the generator
+        first.save(out_buffer, format="GIF", save_all=True, append_images=iter_frames_rgba(img, start=1), loop=loop, duration=duration, disposal=2)
     except Exception:
-        return []
+        img.seek(0)
+        out_buffer.seek(0)
+        out_buffer.truncate()
+        to_rgba(img).save(out_buffer, format="GIF")
+
+# Targets without an entry here go through save_generic
+SAVERS = MappingProxyType({
+    "JPEG": save_jpeg,
+    "PNG": save_png,
+    "ICO": save_ico,
+    "GIF": save_gif,
+})
 
 def convert_image_to_bytes(
     img: Image.Image,
@@ -111,69 +299,118 @@ def convert_image_to_bytes(
 ) -> (bytes, str):
     target = normalize_format_name(target_format)
     out_buffer = io.BytesIO()
-    save_kwargs = {}
-    img_to_save = img
-
-    # Handle JPEG background if needed
-    if target == "JPEG":
-        if img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info):
-            # composite onto background color
-            bg = Image.new("RGB", img.size, jpeg_bg_rgb)
-            # If alpha present, use it as mask
-            if img.mode in ("RGBA", "LA"):
-                bg.paste(img, mask=img.split()[-1])
-            else:
-                try:
-                    bg.paste(img)
-                except Exception:
-                    bg.paste(img.convert("RGB"))
-            img_to_save = bg
-        else:
-            img_to_save = img.convert("RGB")
-    else:
-        img_to_save = img
-
-    # ICO: include sizes parameter
-    if target == "ICO":
-        if ico_sizes:
-            save_kwargs["sizes"] = ico_sizes
-
-    # GIF animation preservation
-    if target == "GIF" and getattr(img, "is_animated", False) and preserve_animation:
-        frames = []
-        duration = img.info.get("duration", 100)
-        loop = img.info.get("loop", 0)
-        try:
-            for frame in ImageSequence.Iterator(img):
-                # convert frames to palette if needed
-                frames.append(frame.convert("RGBA"))
-            frames[0].save(out_buffer, format="GIF", save_all=True, append_images=frames[1:], loop=loop, duration=duration, disposal=2)
-        except Exception:
-            img_to_save.convert("RGBA").save(out_buffer, format="GIF")
-    else:
-        # Regular save
-        # Some formats require conversion; Pillow handles many automatically
-        # Use a try/except to catch unsupported format errors.
-        try:
-            img_to_save.save(out_buffer, format=target, **save_kwargs)
-        except Exception as e:
-            # fallback: convert to PNG then attempt to save
-            temp = img_to_save.convert("RGBA")
-            temp.save(out_buffer, format=target if target != "ICO" else "PNG", **save_kwargs)
-
-    out_buffer.seek(0)
-    out_bytes = out_buffer.read()
+    saver = SAVERS.get(target, save_generic)
+
+    # Use a try/except to catch unsupported format errors.
+    try:
+        saver(img, out_buffer, target, jpeg_bg_rgb=jpeg_bg_rgb, ico_sizes=ico_sizes, preserve_animation=preserve_animation)
+    except Exception:
+        # fallback: convert to RGBA then attempt to save (ICO falls back to PNG)
+        out_buffer.seek(0)
+        out_buffer.truncate()
+        to_rgba(img).save(out_buffer, format=target if target != "ICO" else "PNG")
+
+    out_bytes = out_buffer.getvalue()
     base_name, _ = os.path.splitext(os.path.basename(original_filename))
     out_filename = f"{base_name}{get_extension_for_format(target)}"
     return out_bytes, out_filename
 
+# These outputs are already entropy-coded; deflating them again costs CPU for ~0% gain
+STORED_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp", ".gif", ".ico"}
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def convert_image_cached(
+    content_hash: str,
+    _img: Image.Image,
+    target_format: str,
+    original_filename: str,
+    jpeg_bg_rgb: Tuple[int,int,int],
+    ico_sizes: Tuple[Tuple[int,int], ...],
+    preserve_animation: bool
+) -> (bytes, str):
+    """convert_image_to_bytes keyed on the upload's digest, so Streamlit reruns reuse earlier outputs.
+
+    _img is excluded from the cache key (leading underscore); content_hash stands in for it.
+    """
+    return convert_image_to_bytes(
+        _img,
+        target_format,
+        original_filename,
+        jpeg_bg_rgb=jpeg_bg_rgb,
+        ico_sizes=list(ico_sizes) if ico_sizes else None,
+        preserve_animation=preserve_animation
+    )
+
+# Archives larger than this are spooled to disk while being built
+ZIP_SPOOL_MAX_SIZE = 64 * 1024 * 1024
+
 def make_zip_bytes(files: List[Tuple[bytes,str]]) -> (bytes, str):
-    buf = io.BytesIO()
-    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
-        for content, filename in files:
-            zf.writestr(filename, content)
-    buf.seek(0)
-    return buf.read(), "converted_images.zip"
+    with SpooledTemporaryFile(max_size=ZIP_SPOOL_MAX_SIZE) as buf:
+        with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+            for content, filename in files:
+                ext = os.path.splitext(filename)[1].lower()
+                compress_type = zipfile.ZIP_STORED if ext in STORED_EXTENSIONS else zipfile.ZIP_DEFLATED
+                zf.writestr(filename, content, compress_type=compress_type)
+        buf.seek(0)
+        return buf.read(), "converted_images.zip"
+
+def convert_upload(
+    up,
+    selected_input: str,
+    want_fmt: str,
+    force_convert: bool,
+    jpeg_bg_rgb: Tuple[int,int,int],
+    ico_sizes: List[Tuple[int,int]],
+    preserve_animation: bool,
+    skip_identical: bool = True,
+    decoded_cache: dict = None
+):
+    """Validate and convert one uploaded file.
+
+    Returns (converted, skipped, error); exactly one of them is set.
+    """
+    target = normalize_format_name(want_fmt)
+    # ICO frames top out at the largest requested size, so there's no need to decode beyond it
+    draft_size = None
+    if target == "ICO" and ico_sizes:
+        max_side = max(max(size) for size in ico_sizes)
+        draft_size = (max_side, max_side)
+
+    try:
+        try:
+            img = decode_upload(up, decoded_cache if decoded_cache is not None else {}, draft_size=draft_size)
+        except UnidentifiedImageError:
+            # not an image — skip
+            return None, (up.name, "Unidentified image"), None
+
+        detected_format = image_format_from_pil(img, up.name)
+        detected_norm = normalize_format_name(detected_format)
+
+        if (selected_input != detected_norm) and (not force_convert):
+            return None, (up.name, f"Format mismatch (detected: {detected_norm})"), None
+
+        # ICO sizes and unchecked GIF animation both need a re-encode, so those never pass through
+        options_apply = target == "ICO" or (target == "GIF" and not preserve_animation)
+        if skip_identical and target == detected_norm and not options_apply:
+            # already in the requested format: hand back the upload instead of a lossy re-encode,
+            # but still name it for its real format (the upload's extension may be wrong)
+            base_name, _ = os.path.splitext(os.path.basename(up.name))
+            out_filename = f"{base_name}{get_extension_for_format(target)}"
+            return (up.getvalue(), out_filename, detected_norm), None, None
+
+        # convert (ico_sizes must be a tuple to be hashable for the cache key)
+        out_bytes, out_filename = convert_image_cached(
+            upload_digest(up),
+            img,
+            want_fmt,
+            up.name,
+            jpeg_bg_rgb=jpeg_bg_rgb,
+            ico_sizes=tuple(ico_sizes) if ico_sizes else None,
+            preserve_animation=preserve_animation
+        )
+        return (out_bytes, out_filename, detected_norm), None, None
+    except Exception as e:
+        return None, None, (up.name, str(e))
 
 # ------------------------
 # UI parts
@@ -201,8 +438,21 @@ def format_dropdowns(available_choices):
         want_fmt = st.selectbox("Convert to (select output format)", available_choices, index=1, help="Choose the format to convert into.")
     return have_fmt, want_fmt
 
+PREVIEW_MAX_SIDE = 512
+
+def make_preview_bytes(image_bytes: bytes) -> bytes:
+    """Small WEBP thumbnail for st.image, so large PNG/TIFF outputs aren't shipped to the browser in full."""
+    thumb = Image.open(io.BytesIO(image_bytes))
+    if getattr(thumb, "is_animated", False):
+        # a thumbnail would only keep the first frame
+        return image_bytes
+    thumb.thumbnail((PREVIEW_MAX_SIDE, PREVIEW_MAX_SIDE))
+    tbuf = io.BytesIO()
+    thumb.save(tbuf, "WEBP", quality=80, method=4)
+    return tbuf.getvalue()
+
 def show_preview_and_download_single(img_preview_bytes: bytes, caption: str, out_filename: str, mime: str):
-    st.image(img_preview_bytes, caption=caption, use_column_width=True)
+    st.image(make_preview_bytes(img_preview_bytes), caption=caption, use_column_width=True)
     st.download_button(label="Download", data=img_preview_bytes, file_name=out_filename, mime=mime)
 
 # ------------------------
@@ -230,6 +480,7 @@ def main():
     with col_a:
         force_convert = st.checkbox("Force convert even if detected format doesn't match 'I have'", value=False, help="If unchecked, files whose detected formats don't match your 'I have' selection will be skipped.")
         preserve_animation = st.checkbox("Preserve GIF animation when converting to GIF", value=True)
+        skip_identical = st.checkbox("Skip re-encode when formats match", value=True, help="Files already in the output format are returned unchanged. ICO output, and GIF output with animation disabled, are always re-encoded so those options still apply.")
     with col_b:
         jpeg_bg_color = st.color_picker("JPEG background color (used when compositing transparency)", value="#FFFFFF")
         st.caption("Pick a background color for places that were transparent (applies only when converting to JPEG).")
@@ -246,6 +497,14 @@ def main():
 
     info_placeholder = st.empty()
 
+    # Decoded images live in this session only and are dropped as soon as their upload is removed.
+    # Resolved here because worker threads have no script context to reach st.session_state from.
+    live_ids = {up.file_id for up in uploaded_files or []}
+    decoded_cache = {
+        file_id: entry for file_id, entry in st.session_state.get("decoded_uploads", {}).items() if file_id in live_ids
+    }
+    st.session_state["decoded_uploads"] = decoded_cache
+
     if not uploaded_files:
         st.info("Upload images (single or multiple), choose formats and options, then click Convert.")
     else:
@@ -255,7 +514,7 @@ def main():
         converted_files = []  # list of tuples (bytes, filename)
         skipped_files = []
         errors = []
-        jpeg_rgb = tuple(int(jpeg_bg_color.lstrip("#")[i:i+2], 16) for i in (0, 2, 4))
+        jpeg_rgb = parse_hex_color(jpeg_bg_color)
 
         # prepare ICO sizes list
         if ico_preset.startswith("Default") or ico_preset.startswith("All"):
@@ -272,46 +531,41 @@ def main():
         else:
             ico_sizes = [(256,256),(128,128),(64,64)]
 
-        for up in uploaded_files:
-            try:
-                try:
-                    img = read_image_from_upload(up)
-                except UnidentifiedImageError:
-                    # not an image — skip
-                    skipped_files.append((up.name, "Unidentified image"))
-                    continue
-
-                detected_format = image_format_from_pil(img, up.name)
-                selected_input = normalize_format_name(have_fmt)
-                detected_norm = normalize_format_name(detected_format)
-
-                if (selected_input != detected_norm) and (not force_convert):
-                    skipped_files.append((up.name, f"Format mismatch (detected: {detected_norm})"))
-                    continue
-
-                # convert
-                out_bytes, out_filename = convert_image_to_bytes(
-                    img,
-                    want_fmt,
-                    up.name,
-                    jpeg_bg_rgb=jpeg_rgb,
-                    ico_sizes=ico_sizes,
-                    preserve_animation=preserve_animation
-                )
-                converted_files.append((out_bytes, out_filename, detected_norm))
-            except Exception as e:
-                errors.append((up.name, str(e)))
+        selected_input = normalize_format_name(have_fmt)
+        convert_one = functools.partial(
+            convert_upload,
+            selected_input=selected_input,
+            want_fmt=want_fmt,
+            force_convert=force_convert,
+            jpeg_bg_rgb=jpeg_rgb,
+            ico_sizes=ico_sizes,
+            preserve_animation=preserve_animation,
+            skip_identical=skip_identical,
+            decoded_cache=decoded_cache,
+        )
+        # Pillow's codecs release the GIL, so batches scale across cores; map() keeps upload order
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+            results = list(ex.map(convert_one, uploaded_files))
+
+        for converted, skipped, error in results:
+            if converted:
+                converted_files.append(converted)
+            elif skipped:
+                skipped_files.append(skipped)
+            elif error:
+                errors.append(error)
 
         # Results
         st.markdown("### Results")
         if converted_files:
             st.success(f"Converted {len(converted_files)} file(s).")
+            preview_mime = f"image/{normalize_format_name(want_fmt).lower()}"
             # Show previews in rows of 2
             for i, (content, filename, detected_norm) in enumerate(converted_files):
                 with st.expander(f"{filename} — detected as {detected_norm}", expanded=(i<3)):
                     # show preview (limit large files)
                     try:
-                        show_preview_and_download_single(content, caption=f"{filename}", out_filename=filename, mime=f"image/{normalize_format_name(want_fmt).lower()}")
+                        show_preview_and_download_single(content, caption=f"{filename}", out_filename=filename, mime=preview_mime)
                     except Exception:
                         # fallback to original preview if converted not displayable
                         st.write("Preview not available for this format; download below.")